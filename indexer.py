@@ -5,8 +5,13 @@ https://github.com/KayumovRu/indexer-py
 """
 
 import os
+import re
+import sys
 import ast
 import fnmatch
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 __version__ = "0.1.3"
 
@@ -17,14 +22,17 @@ MAP_DEFINITIONS = os.path.join(OUTPUT_DIR, "map_definitions.txt")
 DEPENDENCIES = os.path.join(OUTPUT_DIR, "dependencies.txt")
 STATS = os.path.join(OUTPUT_DIR, "stat.txt")
 
-# Single ignore set for files and directories (patterns ending with "/" indicate directories)
+# Below this many Python files, analysis runs in-process; starting worker processes costs more than it saves.
+PARALLEL_MIN_FILES = 64
+
+# Single ignore set for files and directories (patterns ending with "/" indicate directories).
+# Entries starting with "." are always skipped before IGNORE is consulted.
 IGNORE = {
     OUTPUT_DIR + "/",
     "__pycache__/",
     "venv/",
     "env/",
     "logs/",
-    ".*",
     "indexer.py",
     "bot.log",
     "*.md",
@@ -37,19 +45,48 @@ IGNORE = {
     "LICENSE"
 }
 
+# IGNORE partitioned by kind at import time, so that most checks are a set lookup or a
+# single str.endswith call instead of an fnmatch call per pattern. Like fnmatch, patterns
+# and names are compared after os.path.normcase (case-insensitive on Windows).
+_GLOB_CHARS = re.compile(r"[*?\[]")
+_IGNORE_PATTERNS = {(p.endswith("/"), os.path.normcase(p.rstrip("/"))) for p in IGNORE}
+_LITERAL_FILES = frozenset(p for dir_only, p in _IGNORE_PATTERNS if not dir_only and not _GLOB_CHARS.search(p))
+_LITERAL_DIRS = frozenset(p for dir_only, p in _IGNORE_PATTERNS if dir_only and not _GLOB_CHARS.search(p))
+_SUFFIX_PATTERNS = {
+    (dir_only, p) for dir_only, p in _IGNORE_PATTERNS
+    if not dir_only and p.startswith("*.") and not _GLOB_CHARS.search(p[1:])
+}
+_SUFFIXES = tuple(p[1:] for _, p in _SUFFIX_PATTERNS)
+_COMPILED_IGNORE = [
+    (dir_only, re.compile(fnmatch.translate(p)))
+    for dir_only, p in _IGNORE_PATTERNS - _SUFFIX_PATTERNS
+    if _GLOB_CHARS.search(p)
+]
+
+# Tree-drawing chunks: branch connectors and the indentation they leave for nested lines.
+_BRANCH, _LAST, _VBAR, _SPACE = map(sys.intern, ("├── ", "└── ", "│   ", "    "))
+
+# Docstring section headers; the rest of a header line is not part of the section.
+_SECTION_RE = re.compile(r"(?m)^[ \t]*(Args|Returns):.*$")
+
 # ---------------------- Utility Functions ---------------------- #
 def is_ignored(item, is_dir=False):
     """
     Checks if the given item (file or directory name) matches any pattern in IGNORE.
     For directory patterns, the pattern must end with a "/".
     """
-    for pattern in IGNORE:
-        if pattern.endswith("/"):
-            if is_dir and fnmatch.fnmatch(item + "/", pattern):
-                return True
-        else:
-            if fnmatch.fnmatch(item, pattern):
-                return True
+    item = os.path.normcase(item)
+    if item.endswith(_SUFFIXES):
+        return True
+    if is_dir and item in _LITERAL_DIRS:
+        return True
+    if item in _LITERAL_FILES:
+        return True
+    for dir_only, regex in _COMPILED_IGNORE:
+        if dir_only and not is_dir:
+            continue
+        if regex.match(item):
+            return True
     return False
 
 def parse_docstring_sections(docstring):
@@ -59,24 +96,13 @@ def parse_docstring_sections(docstring):
       - Args lines (after the 'Args:' header)
       - Returns lines (after the 'Returns:' header)
     """
-    base_lines, args_lines, returns_lines = [], [], []
-    mode = "base"
-    for line in docstring.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("Args:"):
-            mode = "Args"
-            continue
-        elif stripped.startswith("Returns:"):
-            mode = "Returns"
-            continue
-        else:
-            if mode == "base":
-                base_lines.append(stripped)
-            elif mode == "Args" and stripped:
-                args_lines.append(stripped)
-            elif mode == "Returns" and stripped:
-                returns_lines.append(stripped)
-    base_doc = " ".join(base_lines).strip()
+    # Splitting yields [base, header, text, header, text, ...] with headers in any order.
+    parts = _SECTION_RE.split(docstring)
+    args_lines, returns_lines = [], []
+    for header, text in zip(parts[1::2], parts[2::2]):
+        section_lines = args_lines if header == "Args" else returns_lines
+        section_lines.extend(stripped for stripped in map(str.strip, text.splitlines()) if stripped)
+    base_doc = " ".join(map(str.strip, parts[0].splitlines())).strip()
     return base_doc, args_lines, returns_lines
 
 def extract_preceding_comments(source_lines, start_line):
@@ -86,165 +112,302 @@ def extract_preceding_comments(source_lines, start_line):
     comments = []
     idx = start_line - 2  # Convert 1-indexed to 0-indexed; start from the previous line.
     while idx >= 0:
-        line = source_lines[idx].rstrip()
-        if not line.strip():
+        line = source_lines[idx].strip()
+        if not line.startswith("#"):
             break
-        if line.strip().startswith("#"):
-            comments.insert(0, line.strip()[1:].strip())
-            idx -= 1
-        else:
-            break
-    return " ".join(comments).strip()
+        comments.append(line[1:].strip())
+        idx -= 1
+    return " ".join(reversed(comments)).strip()
 
 # ---------------------- AST Parsing Functions ---------------------- #
-def extract_entities(nodes, source_lines):
+class ModuleVisitor(ast.NodeVisitor):
     """
-    Recursively extracts entities (functions, async functions, classes) from AST nodes.
-    Each entity is represented as (Type, Name, Annotation, Children).
+    Collects everything the indexer needs from a module:
+      - entities (functions, async functions, classes), each represented as (Type, Name, Annotation, Children)
+      - imported modules
+      - called functions/classes
+    Only definitions placed directly in a module, class or function body are entities, so the visitor
+    recurses through definition bodies only; imports and calls are gathered with the iterative ast.walk,
+    which keeps deeply nested expressions from exhausting the recursion limit.
     For functions, any 'Args:' or 'Returns:' sections in the docstring are added as child nodes.
     """
-    entities = []
-    for node in nodes:
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            start_line = node.lineno
-            if node.decorator_list:
-                deco_lines = [d.lineno for d in node.decorator_list]
-                start_line = min(start_line, min(deco_lines))
-            comment_block = extract_preceding_comments(source_lines, start_line)
-            docstring = ast.get_docstring(node) or ""
-            base_doc, args_list, returns_list = parse_docstring_sections(docstring)
-            annotation = (comment_block + " | " + base_doc) if comment_block and base_doc else (comment_block or base_doc)
-            etype = "Async Function" if isinstance(node, ast.AsyncFunctionDef) else "Function"
-            body_entities = extract_entities(node.body, source_lines)
-            extra_children = []
-            if args_list:
-                extra_children.append(("Args", "", "\n".join(args_list), []))
-            if returns_list:
-                extra_children.append(("Returns", "", "\n".join(returns_list), []))
-            entities.append((etype, node.name, annotation, extra_children + body_entities))
-        elif isinstance(node, ast.ClassDef):
-            start_line = node.lineno
-            if node.decorator_list:
-                deco_lines = [d.lineno for d in node.decorator_list]
-                start_line = min(start_line, min(deco_lines))
-            comment_block = extract_preceding_comments(source_lines, start_line)
-            docstring = ast.get_docstring(node) or ""
-            annotation = (comment_block + " | " + docstring) if comment_block and docstring else (comment_block or docstring)
-            children = extract_entities(node.body, source_lines)
-            entities.append(("Class", node.name, annotation, children))
-    return entities
-
-def parse_py_file(filepath):
-    """
-    Parses a Python file to extract its module-level docstring and entities.
+
+    def __init__(self, source_lines):
+        self.source_lines = source_lines
+        self.entities = []
+        self.imports, self.calls = set(), set()
+
+    def visit_Module(self, node):
+        self.entities = self._visit_body(node.body)
+        for n in ast.walk(node):
+            if isinstance(n, ast.Import):
+                for alias in n.names:
+                    self.imports.add(alias.name)
+            elif isinstance(n, ast.ImportFrom):
+                if n.module:
+                    self.imports.add(n.module)
+            elif isinstance(n, ast.Call):
+                name = get_full_name(n.func)
+                if name:
+                    self.calls.add(name)
+
+    def generic_visit(self, node):
+        # Statements other than definitions hold no entities.
+        return None
+
+    def _visit_body(self, body):
+        """
+        Returns the entities defined directly in a module, class or function body.
+        """
+        entities = []
+        for stmt in body:
+            entity = self.visit(stmt)
+            if entity is not None:
+                entities.append(entity)
+        return entities
+
+    def _comment_block(self, node):
+        """
+        Returns the comments preceding a definition, including its decorators.
+        """
+        start_line = node.lineno
+        if node.decorator_list:
+            deco_lines = [d.lineno for d in node.decorator_list]
+            start_line = min(start_line, min(deco_lines))
+        return extract_preceding_comments(self.source_lines, start_line)
+
+    def visit_FunctionDef(self, node):
+        comment_block = self._comment_block(node)
+        docstring = ast.get_docstring(node) or ""
+        base_doc, args_list, returns_list = parse_docstring_sections(docstring)
+        annotation = (comment_block + " | " + base_doc) if comment_block and base_doc else (comment_block or base_doc)
+        etype = "Async Function" if isinstance(node, ast.AsyncFunctionDef) else "Function"
+        extra_children = []
+        if args_list:
+            extra_children.append(("Args", "", "\n".join(args_list), []))
+        if returns_list:
+            extra_children.append(("Returns", "", "\n".join(returns_list), []))
+        return (etype, node.name, annotation, extra_children + self._visit_body(node.body))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node):
+        comment_block = self._comment_block(node)
+        docstring = ast.get_docstring(node) or ""
+        annotation = (comment_block + " | " + docstring) if comment_block and docstring else (comment_block or docstring)
+        return ("Class", node.name, annotation, self._visit_body(node.body))
+
+def read_source(filepath):
+    """
+    Reads the raw bytes of a file, or returns None if it cannot be read.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            return f.read()
+    except Exception:
+        return None
+
+def _parse_source(filepath, data):
+    """
+    Decodes and parses the raw bytes of a Python file.
+    Returns (source, source_lines, tree), or None if the source cannot be decoded or parsed.
     """
+    if data is None:
+        return None
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            source = f.read()
+        source = data.decode("utf-8")
+        node = compile(source, filepath, "exec", ast.PyCF_ONLY_AST)
     except Exception:
-        return "", []
-    source_lines = source.splitlines()
+        return None
+    return source, source.splitlines(), node
+
+def analyze_py_file(filepath, data):
+    """
+    Parses the raw contents of a Python file once and returns:
+      (module-level docstring, entities, set of imported modules, set of called functions/classes)
+    """
+    loaded = _parse_source(filepath, data)
+    if loaded is None:
+        return "", [], set(), set()
+    _, source_lines, node = loaded
     try:
-        node = ast.parse(source, filepath)
+        visitor = ModuleVisitor(source_lines)
+        visitor.visit(node)
+        mod_doc = ast.get_docstring(node) or ""
     except Exception:
-        return "", []
-    mod_doc = ast.get_docstring(node) or ""
-    entities = extract_entities(node.body, source_lines)
-    return mod_doc, entities
+        # A single unanalyzable file (e.g. RecursionError on extreme nesting) must not abort the run.
+        return "", [], set(), set()
+    return mod_doc, visitor.entities, visitor.imports, visitor.calls
 
-def format_entity_tree(entities, prefix=""):
+def format_entity_tree(entities, prefix_parts, out):
     """
-    Recursively formats entities into a tree structure with branch connectors.
+    Recursively formats entities into a tree structure with branch connectors, appending lines to out.
+    prefix_parts is the list of indentation chunks for the current depth; it is extended and
+    restored in place while descending.
     For 'Args' and 'Returns' nodes, multi-line annotations are split into child lines.
     """
-    lines = []
     count = len(entities)
     for idx, (etype, name, annotation, children) in enumerate(entities):
         is_last = (idx == count - 1)
-        connector = "└── " if is_last else "├── "
-        line = prefix + connector + f"[{etype}] {name}"
+        connector = _LAST if is_last else _BRANCH
+        line = "".join(prefix_parts) + connector + f"[{etype}] {name}"
         if annotation and etype not in ("Args", "Returns"):
             line += f"  # {annotation}"
-        lines.append(line)
-        if etype in ("Args", "Returns") and annotation:
-            ann_lines = annotation.split("\n")
-            ann_count = len(ann_lines)
-            new_prefix = prefix + ("    " if is_last else "│   ")
-            for i, ann_line in enumerate(ann_lines):
-                ann_connector = "└── " if i == ann_count - 1 else "├── "
-                lines.append(new_prefix + ann_connector + ann_line)
-        if children:
-            new_prefix = prefix + ("    " if is_last else "│   ")
-            lines.extend(format_entity_tree(children, new_prefix))
-    return lines
+        out.append(line)
+        is_section = etype in ("Args", "Returns") and annotation
+        if is_section or children:
+            prefix_parts.append(_SPACE if is_last else _VBAR)
+            if is_section:
+                ann_lines = annotation.split("\n")
+                ann_count = len(ann_lines)
+                new_prefix = "".join(prefix_parts)
+                for i, ann_line in enumerate(ann_lines):
+                    ann_connector = _LAST if i == ann_count - 1 else _BRANCH
+                    out.append(new_prefix + ann_connector + ann_line)
+            if children:
+                format_entity_tree(children, prefix_parts, out)
+            prefix_parts.pop()
 
-# ---------------------- File Tree & Definitions ---------------------- #
-def build_tree_files(start_path, prefix=""):
+# ---------------------- Project Traversal ---------------------- #
+def walk_project(start_path, rel_dir="", depth=0):
     """
-    Builds a tree representation of the project structure.
-    For Python files, appends the module-level docstring (if any).
-    Items matching IGNORE are marked as 'ignored' and not processed further.
+    Traverses the project once, depth-first in sorted order, and yields a record per entry:
+      (rel_path, kind, depth, is_last, stat_result)
+    kind is one of 'dir', 'dir_link', 'file', 'ignored_dir' or 'ignored_file'.
+    Ignored directories and symlinks to directories ('dir_link') are not descended into.
+    stat_result is only set for files.
+    Entries starting with '.' are skipped.
     """
-    lines = []
     try:
-        entries = sorted(e for e in os.listdir(start_path) if not e.startswith('.'))
+        with os.scandir(start_path) as it:
+            entries = sorted((e for e in it if e.name[0] != '.'), key=lambda e: e.name)
     except Exception:
-        return lines
+        return
+    count = len(entries)
     for i, entry in enumerate(entries):
-        full_path = os.path.join(start_path, entry)
-        connector = "└── " if i == len(entries) - 1 else "├── "
-        if os.path.isdir(full_path):
-            if is_ignored(entry, is_dir=True):
-                lines.append(prefix + connector + entry + "/  # ignored")
+        is_last = (i == count - 1)
+        rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if is_ignored(entry.name, is_dir=True):
+                yield rel_path, "ignored_dir", depth, is_last, None
             else:
-                lines.append(prefix + connector + entry + "/")
-                new_prefix = prefix + ("    " if i == len(entries) - 1 else "│   ")
-                lines.extend(build_tree_files(full_path, new_prefix))
-        else:
-            if is_ignored(entry, is_dir=False):
-                lines.append(prefix + connector + entry + "  # ignored")
+                yield rel_path, "dir", depth, is_last, None
+                yield from walk_project(entry.path, rel_path, depth + 1)
+        elif entry.is_symlink() and entry.is_dir():
+            if is_ignored(entry.name, is_dir=True):
+                yield rel_path, "ignored_dir", depth, is_last, None
             else:
-                if entry.endswith(".py"):
-                    mod_doc, _ = parse_py_file(full_path)
-                    comment = f"  # {mod_doc}" if mod_doc else ""
-                    lines.append(prefix + connector + entry + comment)
-                else:
-                    lines.append(prefix + connector + entry)
+                yield rel_path, "dir_link", depth, is_last, None
+        elif is_ignored(entry.name, is_dir=False):
+            yield rel_path, "ignored_file", depth, is_last, None
+        else:
+            try:
+                stat_result = entry.stat()
+            except Exception:
+                stat_result = None
+            yield rel_path, "file", depth, is_last, stat_result
+
+def _read_and_analyze(filepath):
+    """
+    Reads and analyzes a Python file (see analyze_py_file). Runs in the worker processes,
+    so each worker reads its own files and no source is sent between processes.
+    """
+    return analyze_py_file(filepath, read_source(filepath))
+
+def _analyze_in_process(paths):
+    """
+    Analyzes Python files in the current process. Their contents are read ahead on a thread pool,
+    which stays alive while the files are parsed so that reads overlap the parsing.
+    """
+    with ThreadPoolExecutor(max_workers=32) as reader:
+        return [analyze_py_file(path, data) for path, data in zip(paths, reader.map(read_source, paths))]
+
+def analyze_py_files(start_path, py_files):
+    """
+    Analyzes Python files (see analyze_py_file), in parallel worker processes once there are
+    at least PARALLEL_MIN_FILES of them.
+    py_files are relative paths, as found by walk_project.
+    Returns a dict mapping each relative path to its analysis, in the same order.
+    """
+    paths = [os.path.join(start_path, rel_path) for rel_path in py_files]
+    results = []
+    if len(paths) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor() as executor:
+                for result in executor.map(_read_and_analyze, paths, chunksize=16):
+                    results.append(result)
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # Multiprocessing is not available on this platform, or a worker died. Finished results
+            # are kept and only the remaining files are analyzed in-process; a file that killed its
+            # worker is among them and may fail the same way here.
+            pass
+    results += _analyze_in_process(paths[len(results):])
+    return dict(zip(py_files, results))
+
+# ---------------------- File Tree & Definitions ---------------------- #
+def build_tree_files(records, analyses):
+    """
+    Builds a tree representation of the project structure from walk_project records
+    and the analyses of its Python files.
+    For Python files, appends the module-level docstring (if any).
+    Symlinked directories are marked as 'symlink' and not descended into.
+    Items matching IGNORE are marked as 'ignored' and not processed further.
+    """
+    lines = []
+    prefix_parts = []
+    for rel_path, kind, depth, is_last, _ in records:
+        del prefix_parts[depth:]
+        prefix = "".join(prefix_parts)
+        connector = _LAST if is_last else _BRANCH
+        name = os.path.basename(rel_path)
+        if kind == "dir":
+            lines.append(prefix + connector + name + "/")
+            prefix_parts.append(_SPACE if is_last else _VBAR)
+        elif kind == "dir_link":
+            lines.append(prefix + connector + name + "/  # symlink")
+        elif kind == "ignored_dir":
+            lines.append(prefix + connector + name + "/  # ignored")
+        elif kind == "ignored_file":
+            lines.append(prefix + connector + name + "  # ignored")
+        elif rel_path in analyses:
+            mod_doc = analyses[rel_path][0]
+            comment = f"  # {mod_doc}" if mod_doc else ""
+            lines.append(prefix + connector + name + comment)
+        else:
+            lines.append(prefix + connector + name)
     return lines
 
-def build_map_definitions(start_path, prefix=""):
+def build_map_definitions(records, analyses):
     """
     Builds a tree of detailed definitions (functions, classes, nested entities)
-    for each Python file in the project.
+    for each Python file in the project, from walk_project records and file analyses.
+    Symlinked directories are marked as 'symlink' and not descended into.
     Items matching IGNORE are marked as 'ignored' and not processed.
     Output is intended for 'map_definitions.txt'.
     """
     lines = []
-    try:
-        entries = sorted(e for e in os.listdir(start_path) if not e.startswith('.'))
-    except Exception:
-        return lines
-    for i, entry in enumerate(entries):
-        full_path = os.path.join(start_path, entry)
-        connector = "└── " if i == len(entries) - 1 else "├── "
-        if os.path.isdir(full_path):
-            if is_ignored(entry, is_dir=True):
-                lines.append(prefix + connector + entry + "/  # ignored")
-            else:
-                lines.append(prefix + connector + entry + "/")
-                new_prefix = prefix + ("    " if i == len(entries) - 1 else "│   ")
-                lines.extend(build_map_definitions(full_path, new_prefix))
-        else:
-            if is_ignored(entry, is_dir=False):
-                lines.append(prefix + connector + entry + "  # ignored")
-            else:
-                if entry.endswith(".py"):
-                    mod_doc, entities = parse_py_file(full_path)
-                    comment = f"  # {mod_doc}" if mod_doc else ""
-                    lines.append(prefix + connector + entry + comment)
-                    new_prefix = prefix + ("    " if i == len(entries) - 1 else "│   ") + "    "
-                    if entities:
-                        lines.extend(format_entity_tree(entities, new_prefix))
+    prefix_parts = []
+    for rel_path, kind, depth, is_last, _ in records:
+        del prefix_parts[depth:]
+        prefix = "".join(prefix_parts)
+        connector = _LAST if is_last else _BRANCH
+        name = os.path.basename(rel_path)
+        if kind == "dir":
+            lines.append(prefix + connector + name + "/")
+            prefix_parts.append(_SPACE if is_last else _VBAR)
+        elif kind == "dir_link":
+            lines.append(prefix + connector + name + "/  # symlink")
+        elif kind == "ignored_dir":
+            lines.append(prefix + connector + name + "/  # ignored")
+        elif kind == "ignored_file":
+            lines.append(prefix + connector + name + "  # ignored")
+        elif rel_path in analyses:
+            mod_doc, entities, _, _ = analyses[rel_path]
+            comment = f"  # {mod_doc}" if mod_doc else ""
+            lines.append(prefix + connector + name + comment)
+            if entities:
+                prefix_parts += (_SPACE if is_last else _VBAR, _SPACE)
+                format_entity_tree(entities, prefix_parts, lines)
     return lines
 
 # ---------------------- Dependency Helpers ---------------------- #
@@ -252,89 +415,45 @@ def get_full_name(node):
     """
     Reconstructs the full name of a called function/class from an AST node.
     """
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
     if isinstance(node, ast.Name):
-        return node.id
-    elif isinstance(node, ast.Attribute):
-        prefix = get_full_name(node.value)
-        return f"{prefix}.{node.attr}" if prefix else node.attr
-    return ""
+        parts.append(node.id)
+    # Attribute chains on other expressions (e.g. 'f().attr') keep only the attribute names.
+    return ".".join(reversed(parts))
 
-def get_used_entities(filepath):
+def build_local_modules(py_files):
     """
-    Analyzes a Python file and returns:
-      (set of imported modules, set of called functions/classes)
-    """
-    imports, calls = set(), set()
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            source = f.read()
-    except Exception:
-        return imports, calls
-    try:
-        node = ast.parse(source, filepath)
-    except Exception:
-        return imports, calls
-    for n in ast.walk(node):
-        if isinstance(n, ast.Import):
-            for alias in n.names:
-                imports.add(alias.name)
-        elif isinstance(n, ast.ImportFrom):
-            if n.module:
-                imports.add(n.module)
-        elif isinstance(n, ast.Call):
-            name = get_full_name(n.func)
-            if name:
-                calls.add(name)
-    return imports, calls
-
-def build_local_modules(start_path):
-    """
-    Scans the project for Python files and builds a mapping from fully qualified module names
-    to their relative file paths.
+    Builds the set of fully qualified module names of the project's Python files,
+    as found by walk_project.
     For a file at 'pkg/subpkg/module.py', the module name is assumed to be 'pkg.subpkg.module'.
     For __init__.py files, the module name is the package name.
-    Items matching IGNORE are skipped.
-    """
-    local_modules = {}
-    for root, dirs, files in os.walk(start_path):
-        dirs[:] = [d for d in dirs if not d.startswith('.') and not is_ignored(d, is_dir=True)]
-        for file in files:
-            if file.endswith(".py") and not is_ignored(file, is_dir=False):
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, start_path)
-                parts = rel_path.split(os.sep)
-                if parts[-1] == "__init__.py":
-                    mod_name = ".".join(parts[:-1])
-                else:
-                    mod_name = ".".join(parts)[:-3]  # remove .py extension
-                local_modules[mod_name] = rel_path
+    """
+    local_modules = set()
+    for rel_path in py_files:
+        parts = rel_path.split(os.sep)
+        if parts[-1] == "__init__.py":
+            local_modules.add(".".join(parts[:-1]))
+        else:
+            local_modules.add(".".join(parts)[:-3])  # remove .py extension
     return local_modules
 
-def build_dependencies(start_path):
+def build_dependencies(analyses):
     """
-    Builds dependencies for each Python file by listing imported modules and used functions/classes.
+    Builds dependencies for each Python file by listing imported modules and used functions/classes,
+    from the analyses of the project's Python files.
     The output starts with a section listing all external libraries (top-level names)
     excluding those corresponding to local modules.
-    Items matching IGNORE are skipped.
     """
     all_imports = set()
     file_deps = []
-    for root, dirs, files in os.walk(start_path):
-        dirs[:] = [d for d in dirs if not is_ignored(d, is_dir=True)]
-        for file in files:
-            if file.endswith(".py") and not is_ignored(file, is_dir=False):
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, start_path)
-                imports, calls = get_used_entities(full_path)
-                all_imports.update(imports)
-                file_deps.append((rel_path, imports, calls))
-    local_modules = build_local_modules(start_path)
-    external_libs = set()
-    for mod in all_imports:
-        top_level = mod.split('.')[0]
-        if top_level not in local_modules:
-            external_libs.add(top_level)
-    external_libs = sorted(external_libs)
+    for rel_path, (_, _, imports, calls) in analyses.items():
+        all_imports.update(imports)
+        file_deps.append((rel_path, imports, calls))
+    local_modules = build_local_modules(analyses)
+    external_libs = sorted({mod.partition('.')[0] for mod in all_imports} - local_modules)
     
     lines = []
     lines.append("Project External Libraries:")
@@ -355,31 +474,40 @@ def build_dependencies(start_path):
     return lines
 
 # ---------------------- Statistics ---------------------- #
-def build_stats(start_path):
+def count_lines(filepath, chunk_size=1 << 20):
     """
-    Computes project statistics:
+    Counts the lines of a file by counting newlines in large binary chunks.
+    A last line without a trailing newline is counted as well.
+    """
+    count = 0
+    last_chunk = b""
+    with open(filepath, "rb") as f:
+        for chunk in iter(functools.partial(f.read, chunk_size), b""):
+            count += chunk.count(b"\n")
+            last_chunk = chunk
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        count += 1
+    return count
+
+def build_stats(records, start_path):
+    """
+    Computes project statistics from walk_project records:
       - Number of directories
       - Number of files (excluding ignored items)
       - Total number of lines (excluding ignored items)
       - Total number of bytes (excluding ignored items)
     """
     dirs_count = files_count = lines_count = bytes_count = 0
-    for root, dirs, files in os.walk(start_path):
-        dirs[:] = [d for d in dirs if not d.startswith('.') and not is_ignored(d, is_dir=True)]
-        for d in dirs:
+    for rel_path, kind, _, _, stat_result in records:
+        if kind == "dir" or kind == "dir_link":
             dirs_count += 1
-        for file in files:
-            if is_ignored(file, is_dir=False):
-                continue
+        elif kind == "file":
             files_count += 1
-            full_path = os.path.join(root, file)
-            try:
-                bytes_count += os.path.getsize(full_path)
-            except Exception:
-                pass
+            if stat_result is None or not stat_result.st_size:
+                continue
+            bytes_count += stat_result.st_size
             try:
-                with open(full_path, "rb") as f:
-                    lines_count += sum(1 for _ in f)
+                lines_count += count_lines(os.path.join(start_path, rel_path))
             except Exception:
                 pass
     return dirs_count, files_count, lines_count, bytes_count
@@ -387,11 +515,12 @@ def build_stats(start_path):
 # ---------------------- File Writing ---------------------- #
 def write_file(filepath, header, lines):
     """
-    Writes the header and content lines to a file.
+    Writes the header and content lines to a file, streaming the lines through a large buffer.
     """
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(header + "\n\n")
-        f.write("\n".join(lines))
+    with open(filepath, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(header)
+        f.write("\n\n")
+        f.writelines(line + "\n" for line in lines)
 
 # ---------------------- Main ---------------------- #
 if __name__ == "__main__":
@@ -427,11 +556,16 @@ if __name__ == "__main__":
         "# Usage: Open this file to see the project's overall statistics."
     )
 
+    # Traverse the project once; every output section is built from the same records.
+    records = list(walk_project(start_dir))
+    py_files = [rel_path for rel_path, kind, _, _, _ in records if kind == "file" and rel_path.endswith(".py")]
+    analyses = analyze_py_files(start_dir, py_files)
+
     # Build output sections
-    tree_files_lines = build_tree_files(start_dir)
-    map_definitions_lines = build_map_definitions(start_dir)
-    dependencies_lines = build_dependencies(start_dir)
-    dirs_count, files_count, lines_count, bytes_count = build_stats(start_dir)
+    tree_files_lines = build_tree_files(records, analyses)
+    map_definitions_lines = build_map_definitions(records, analyses)
+    dependencies_lines = build_dependencies(analyses)
+    dirs_count, files_count, lines_count, bytes_count = build_stats(records, start_dir)
     stat_lines = [
         f"Number of directories: {dirs_count}",
         f"Number of files: {files_count}",